@@ -0,0 +1,120 @@
+from sorting_algs import Feature
+
+#############################
+# REAL EXAMPLE INPUTS
+#############################
+
+# From image_01.json where numbers_1 text="4" is missing in row=1 col=4
+times_1 = [
+    Feature(text="10:47 PM", x=331, y=3808),
+    Feature(text="10:13 PM", x=306, y=2788),
+    Feature(text="10:29 PM", x=1734, y=3816),
+    Feature(text="10:08 PM", x=1718, y=2780),
+    Feature(text="9:51 PM", x=290, y=1759),
+    Feature(text="9:48 PM", x=1710, y=1743),
+    Feature(text="10:26 PM", x=3171, y=3818),
+    Feature(text="10:02 PM", x=3163, y=2772),
+    Feature(text="9:46 PM", x=3154, y=1733),
+    Feature(text="10:23 PM", x=4599, y=3793),
+    Feature(text="10:01 PM", x=4615, y=2762),
+    Feature(text="9:43 PM", x=4607, y=1725),
+]
+numbers_1 = [
+    Feature(text="1", x=132, y=3736),
+    Feature(text="5", x=107, y=2723),
+    Feature(text="2", x=1519, y=3744),
+    Feature(text="6", x=1511, y=2714),
+    Feature(text="9", x=83, y=1685),
+    Feature(text="10", x=1494, y=1668),
+    Feature(text="3", x=2963, y=3752),
+    Feature(text="7", x=2947, y=2698),
+    Feature(text="11", x=2939, y=1668),
+    Feature(text="8", x=4400, y=2698),
+    Feature(text="12", x=4400, y=1643),
+]
+registers_1 = [
+    Feature(text="Drive Through", x=1129, y=3711),
+    Feature(text="Drive Through", x=1104, y=2681),
+    Feature(text="Drive Through", x=2548, y=3719),
+    Feature(text="Drive Through", x=2548, y=2673),
+    Feature(text="Drive Through", x=1095, y=1643),
+    Feature(text="Drive Through", x=2540, y=1643),
+    Feature(text="Drive Through", x=3993, y=3702),
+    Feature(text="Drive Through", x=3993, y=2665),
+    Feature(text="Drive Through", x=3985, y=1627),
+    Feature(text="Drive Through", x=5413, y=3677),
+    Feature(text="Drive Through", x=5421, y=2656),
+    Feature(text="In-Store", x=5421, y=1618),
+]
+totals_1 = [
+    Feature(text=11.8, x=1021, y=2971),
+    Feature(text=6.12, x=2507, y=2954),
+    Feature(text=6.98, x=1054, y=1933),
+    Feature(text=12.12, x=2455, y=1913),
+    Feature(text=6.77, x=1045, y=894),
+    Feature(text=21.0, x=2449, y=863),
+    Feature(text=10.83, x=3843, y=2939),
+    Feature(text=5.36, x=3943, y=1909),
+    Feature(text=0.0, x=3943, y=855),
+    Feature(text=12.56, x=5338, y=2930),
+    Feature(text=12.12, x=5338, y=1901),
+    Feature(text=0.0, x=5371, y=863),
+]
+
+# From image_15.json where time text="3:02 PM" in row = 2 col = 2
+time_15 = [
+    Feature(text="3:08 PM", x=323, y=3817),
+    Feature(text="3:07 PM", x=1726, y=3835),
+    Feature(text="3:02 PM", x=307, y=2797),
+    Feature(text="2:52 PM", x=290, y=1768),
+    Feature(text="2:51 PM", x=1718, y=1758),
+    Feature(text="3:06 PM", x=3171, y=3834),
+    Feature(text="2:55 PM", x=3162, y=2779),
+    Feature(text="2:50 PM", x=3154, y=1740),
+    Feature(text="3:05 PM", x=4607, y=3809),
+    Feature(text="2:52 PM", x=4616, y=2780),
+    Feature(text="2:48 PM", x=4615, y=1732),
+]
+
+numbers_15 = [
+    Feature(text="169", x=116, y=3744),
+    Feature(text="170", x=1519, y=3760),
+    Feature(text="174", x=1502, y=2723),
+    Feature(text="173", x=99, y=2723),
+    Feature(text="177", x=91, y=1693),
+    Feature(text="178", x=1494, y=1685),
+    Feature(text="171", x=2955, y=3760),
+    Feature(text="175", x=2947, y=2706),
+    Feature(text="179", x=2939, y=1677),
+    Feature(text="172", x=4400, y=3736),
+    Feature(text="176", x=4408, y=2706),
+    Feature(text="180", x=4400, y=1660),
+]
+registers_15 = [
+    Feature(text="In-Store", x=1129, y=3727),
+    Feature(text="Drive Through", x=1104, y=2698),
+    Feature(text="Drive Through", x=2548, y=3727),
+    Feature(text="Delivery", x=2532, y=2681),
+    Feature(text="Drive Through", x=1095, y=1660),
+    Feature(text="Delivery", x=2523, y=1652),
+    Feature(text="Delivery", x=3985, y=3719),
+    Feature(text="Drive Through", x=3993, y=2681),
+    Feature(text="Drive Through", x=3993, y=1635),
+    Feature(text="Drive Through", x=5421, y=3694),
+    Feature(text="Delivery", x=5404, y=2665),
+    Feature(text="Delivery", x=5404, y=1627),
+]
+totals_15 = [
+    Feature(text=0.0, x=1062, y=2979),
+    Feature(text=11.37, x=2465, y=2971),
+    Feature(text=7.98, x=1053, y=1932),
+    Feature(text=14.18, x=2456, y=1931),
+    Feature(text=13.64, x=1004, y=904),
+    Feature(text=6.77, x=2490, y=879),
+    Feature(text=0.0, x=3960, y=2972),
+    Feature(text=0.0, x=3943, y=1925),
+    Feature(text=6.98, x=3943, y=863),
+    Feature(text=19.32, x=5338, y=2947),
+    Feature(text=7.47, x=5388, y=1917),
+    Feature(text=4.06, x=5371, y=870),
+]
@@ -1,7 +1,10 @@
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter, le, neg
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     text: str
     x: int
@@ -11,6 +14,94 @@ class Feature:
         return f"({self.text}, ({self.x}, {self.y}))"
 
 
+# Sort keys for the (y, x, index) triples used internally, built once
+_KEY_Y = itemgetter(0)
+_KEY_X = itemgetter(1)
+
+def _to_soa(features: list[Feature]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Splits a list of Feature objects into parallel x and y coordinate tuples.
+    Sorting and grouping work on (y, x, index) triples built from these tuples,
+    and results are mapped back to the Feature objects only at the end.
+    Tuples (rather than lists) let the coordinates key the result caches.
+    """
+    xs = tuple([f.x for f in features])
+    ys = tuple([f.y for f in features])
+    return xs, ys
+
+
+def _sort_row_by_x(row: list[tuple[int, int, int]]) -> None:
+    """
+    Sorts a row of (y, x, index) triples by x in place. OCR output usually
+    arrives left-to-right already, so the sort is skipped when x never decreases.
+    """
+    row_x = list(map(_KEY_X, row))
+    if not all(map(le, row_x, row_x[1:])):
+        row.sort(key=_KEY_X)
+
+
+def _group_by_y(
+    points: list[tuple[int, int, int]], tol: int
+) -> list[list[tuple[int, int, int]]]:
+    """
+    Groups (y, x, index) triples, already sorted by y descending, into rows.
+    A triple joins the current row if its y is within tol of the y of the
+    row's first triple; otherwise it starts a new row.
+    """
+    it = iter(points)
+    first = next(it, None)
+    if first is None:
+        return []
+
+    # The first triple always opens the first row, so the loop never has to
+    # check for a missing current row.
+    current_row = [first]
+    current_y = first[0]
+    rows = [current_row]
+    for point in it:
+        y = point[0]
+        # points is sorted by y descending, so y <= current_y and no abs() is needed
+        if current_y - y <= tol:
+            current_row.append(point)
+        else:
+            current_row = [point]
+            current_y = y
+            rows.append(current_row)
+    return rows
+
+
+def _row_ids(ys: tuple[int, ...], tol: int) -> list[int]:
+    """
+    Assigns each y coordinate a row number, 0 for the top row.
+    Rows follow the same rule as _group_by_y (a row opens at the highest y not yet
+    placed and takes every y within tol below it), but only the row tops are found
+    by walking the sorted values; each coordinate is then placed by bisecting them.
+    """
+    if not ys:
+        return []
+    ys_desc = sorted(ys, reverse=True)
+    tops = [ys_desc[0]]
+    for y in ys_desc:
+        if tops[-1] - y > tol:
+            tops.append(y)
+    tops.reverse()  # ascending, for bisect
+    last = len(tops) - 1
+    return [last - bisect_left(tops, y) for y in ys]
+
+
+@lru_cache(maxsize=128)
+def _reading_order(ys: tuple[int, ...], xs: tuple[int, ...], tol: int) -> tuple[int, ...]:
+    """
+    Reading-order core of sort_features_A, working only on coordinate tuples.
+    Returns feature indices in reading order. Results are cached on the
+    coordinates, so identical OCR output is only sorted once.
+    """
+    # Reading order is one stable sort by (row, x). Ties in x put the higher
+    # feature first, then fall back to input order.
+    keys = list(zip(_row_ids(ys, tol), xs, map(neg, ys)))
+    return tuple(sorted(range(len(ys)), key=keys.__getitem__))
+
+
 def sort_features_A(features: list[Feature], tol=100) -> list[Feature]:
     """
     Sorts a list of Feature objects in reading order.
@@ -18,32 +109,85 @@ def sort_features_A(features: list[Feature], tol=100) -> list[Feature]:
     Groups features into rows if their y coordinates are within a tolerance,
     then sorts each row by x coordinate (left-to-right).
     """
-    # Sort features by y descending (top to bottom)
-    features_sorted = sorted(features, key=lambda f: f.y, reverse=True)
-    rows = []
-    current_row = []
-    current_y = None
-
-    for f in features_sorted:
-        if current_y is None:
-            current_y = f.y
-            current_row.append(f)
-        elif abs(f.y - current_y) <= tol:
-            current_row.append(f)
-        else:
-            current_row = sorted(current_row, key=lambda f: f.x)
+    xs, ys = _to_soa(features)
+    return [features[i] for i in _reading_order(ys, xs, tol)]
+
+
+_ALIGN_ROW_SRC = """
+def align_row(row, cells, base, tol_x):
+    # Expected column positions are evenly spaced from min_x to max_x.
+    # If there's only one feature, assume expected positions all equal min_x.
+    n = len(row)
+    if n == 1:
+        step = 0
+    else:
+        # Sort the row in place by x ascending (left-to-right); the walk below
+        # needs this order anyway, so min_x and max_x are just its two ends.
+        _sort_row_by_x(row)
+        step = (row[-1][1] - row[0][1]) / {gaps}
+    min_x = row[0][1]
+    j = 0
+"""
+
+# One column of the two-pointer walk: both the expected positions and the row
+# are ordered by x, so features left of the current window can never match a
+# later (further right) column. Once the row is used up the remaining cells
+# stay empty.
+_ALIGN_COLUMN_SRC = """
+    exp_x = min_x + {c} * step
+    while j < n and row[j][1] < exp_x - tol_x:
+        j += 1
+    if j == n:
+        return
+    if abs(row[j][1] - exp_x) <= tol_x:
+        cells[base + {c}] = row[j][2]
+        j += 1
+"""
 
-            rows.append(current_row)
-            current_row = [f]
-            current_y = f.y
 
-    if current_row:
-        current_row = sorted(current_row, key=lambda f: f.x)
-        rows.append(current_row)
+@lru_cache(maxsize=8)
+def _make_row_aligner(n_cols: int):
+    """
+    Generates align_row(row, cells, base, tol_x) specialized for n_cols columns.
+    The column loop is unrolled into straight-line code with the column offsets
+    and the step divisor as constants, so the usual 4-column grid runs without
+    any loop bookkeeping. Writes the index of each matched feature into cells.
+    """
+    src = _ALIGN_ROW_SRC.format(gaps=n_cols - 1)
+    src += "".join(_ALIGN_COLUMN_SRC.format(c=c) for c in range(n_cols))
+    namespace = {"_sort_row_by_x": _sort_row_by_x}
+    exec(src, namespace)
+    return namespace["align_row"]
+
+
+@lru_cache(maxsize=128)
+def _grid_kernel(
+    ys: tuple[int, ...],
+    xs: tuple[int, ...],
+    tol_y: int,
+    tol_x: int,
+    n_rows: int,
+    n_cols: int,
+) -> tuple[int, ...]:
+    """
+    Grid-alignment core of sort_features_B, working only on coordinate tuples.
+    Returns n_rows * n_cols feature indices in row-major order, with -1 for
+    cells where no feature was found. Results are cached on the arguments.
+    """
+    cells = [-1] * (n_rows * n_cols)
 
-    # Flatten the list of rows into a single list
-    sorted_features = [f for row in rows for f in row]
-    return sorted_features
+    # 1. Sort (y, x, index) triples by y descending (higher y means top of the page)
+    points = sorted(zip(ys, xs, range(len(ys))), key=_KEY_Y, reverse=True)
+
+    # 2. Group into rows
+    rows = _group_by_y(points, tol_y)
+
+    # 3. Align the first n_rows rows into n_cols; any missing rows stay empty.
+    align_row = _make_row_aligner(n_cols)
+    for r, row in enumerate(rows[:n_rows]):
+        align_row(row, cells, r * n_cols, tol_x)
+
+    return tuple(cells)
 
 
 def sort_features_B(
@@ -59,191 +203,17 @@ def sort_features_B(
     by x coordinate. For each row, if a cell is missing (i.e. no Feature is found close to the expected x position),
     a None is inserted.
     """
-    # 1. Sort features by y descending (higher y means top of the page)
-    features_sorted = sorted(features, key=lambda f: f.y, reverse=True)
-
-    # 2. Group features into rows
-    rows = []
-    current_row = []
-    current_y = None
-    for f in features_sorted:
-        if current_y is None or abs(f.y - current_y) <= tol_y:
-            current_row.append(f)
-            if current_y is None:
-                current_y = f.y
-        else:
-            rows.append(current_row)
-            current_row = [f]
-            current_y = f.y
-    if current_row:
-        rows.append(current_row)
-
-    # 3. Ensure we have exactly expected_rows: trim or add empty rows.
-    if len(rows) > expected_rows:
-        rows = rows[:expected_rows]
-    elif len(rows) < expected_rows:
-        for _ in range(expected_rows - len(rows)):
-            rows.append([])
-
-    # 4. Process each row to align features into expected_cols.
-    grid = []
-    for row in rows:
-        # Sort the row by x ascending (left-to-right)
-        row_sorted = sorted(row, key=lambda f: f.x)
-        if row_sorted:
-            min_x = row_sorted[0].x
-            max_x = row_sorted[-1].x
-            # If there's only one feature, assume expected positions all equal min_x.
-            if len(row_sorted) == 1:
-                expected_positions = [min_x] * expected_cols
-            else:
-                step = (max_x - min_x) / (expected_cols - 1)
-                expected_positions = [min_x + i * step for i in range(expected_cols)]
-        else:
-            expected_positions = [None] * expected_cols
-
-        # For each expected column position, try to find a feature in row_sorted within tol_x.
-        new_row = []
-        used = set()  # we'll store the id of each Feature to avoid duplicates
-        for exp_x in expected_positions:
-            found = None
-            if exp_x is not None:
-                for f in row_sorted:
-                    if id(f) in used:
-                        continue
-                    if abs(f.x - exp_x) <= tol_x:
-                        found = f
-                        used.add(id(f))
-                        break
-            new_row.append(found)
-        # If the row has fewer than expected_cols, pad with None.
-        while len(new_row) < expected_cols:
-            new_row.append(None)
-        grid.append(new_row)
-
-    # 5. Flatten the grid into a single list (row-major order)
-    flat_list = [cell for row in grid for cell in row]
-    return flat_list
-
-
-#############################
-# REAL EXAMPLE INPUTS
-#############################
-
-# From image_01.json where numbers_1 text="4" is missing in row=1 col=4
-times_1 = [
-    Feature(text="10:47 PM", x=331, y=3808),
-    Feature(text="10:13 PM", x=306, y=2788),
-    Feature(text="10:29 PM", x=1734, y=3816),
-    Feature(text="10:08 PM", x=1718, y=2780),
-    Feature(text="9:51 PM", x=290, y=1759),
-    Feature(text="9:48 PM", x=1710, y=1743),
-    Feature(text="10:26 PM", x=3171, y=3818),
-    Feature(text="10:02 PM", x=3163, y=2772),
-    Feature(text="9:46 PM", x=3154, y=1733),
-    Feature(text="10:23 PM", x=4599, y=3793),
-    Feature(text="10:01 PM", x=4615, y=2762),
-    Feature(text="9:43 PM", x=4607, y=1725),
-]
-numbers_1 = [
-    Feature(text="1", x=132, y=3736),
-    Feature(text="5", x=107, y=2723),
-    Feature(text="2", x=1519, y=3744),
-    Feature(text="6", x=1511, y=2714),
-    Feature(text="9", x=83, y=1685),
-    Feature(text="10", x=1494, y=1668),
-    Feature(text="3", x=2963, y=3752),
-    Feature(text="7", x=2947, y=2698),
-    Feature(text="11", x=2939, y=1668),
-    Feature(text="8", x=4400, y=2698),
-    Feature(text="12", x=4400, y=1643),
-]
-registers_1 = [
-    Feature(text="Drive Through", x=1129, y=3711),
-    Feature(text="Drive Through", x=1104, y=2681),
-    Feature(text="Drive Through", x=2548, y=3719),
-    Feature(text="Drive Through", x=2548, y=2673),
-    Feature(text="Drive Through", x=1095, y=1643),
-    Feature(text="Drive Through", x=2540, y=1643),
-    Feature(text="Drive Through", x=3993, y=3702),
-    Feature(text="Drive Through", x=3993, y=2665),
-    Feature(text="Drive Through", x=3985, y=1627),
-    Feature(text="Drive Through", x=5413, y=3677),
-    Feature(text="Drive Through", x=5421, y=2656),
-    Feature(text="In-Store", x=5421, y=1618),
-]
-totals_1 = [
-    Feature(text=11.8, x=1021, y=2971),
-    Feature(text=6.12, x=2507, y=2954),
-    Feature(text=6.98, x=1054, y=1933),
-    Feature(text=12.12, x=2455, y=1913),
-    Feature(text=6.77, x=1045, y=894),
-    Feature(text=21.0, x=2449, y=863),
-    Feature(text=10.83, x=3843, y=2939),
-    Feature(text=5.36, x=3943, y=1909),
-    Feature(text=0.0, x=3943, y=855),
-    Feature(text=12.56, x=5338, y=2930),
-    Feature(text=12.12, x=5338, y=1901),
-    Feature(text=0.0, x=5371, y=863),
-]
-
-# From image_15.json where time text="3:02 PM" in row = 2 col = 2
-time_15 = [
-    Feature(text="3:08 PM", x=323, y=3817),
-    Feature(text="3:07 PM", x=1726, y=3835),
-    Feature(text="3:02 PM", x=307, y=2797),
-    Feature(text="2:52 PM", x=290, y=1768),
-    Feature(text="2:51 PM", x=1718, y=1758),
-    Feature(text="3:06 PM", x=3171, y=3834),
-    Feature(text="2:55 PM", x=3162, y=2779),
-    Feature(text="2:50 PM", x=3154, y=1740),
-    Feature(text="3:05 PM", x=4607, y=3809),
-    Feature(text="2:52 PM", x=4616, y=2780),
-    Feature(text="2:48 PM", x=4615, y=1732),
-]
-
-numbers_15 = [
-    Feature(text="169", x=116, y=3744),
-    Feature(text="170", x=1519, y=3760),
-    Feature(text="174", x=1502, y=2723),
-    Feature(text="173", x=99, y=2723),
-    Feature(text="177", x=91, y=1693),
-    Feature(text="178", x=1494, y=1685),
-    Feature(text="171", x=2955, y=3760),
-    Feature(text="175", x=2947, y=2706),
-    Feature(text="179", x=2939, y=1677),
-    Feature(text="172", x=4400, y=3736),
-    Feature(text="176", x=4408, y=2706),
-    Feature(text="180", x=4400, y=1660),
-]
-registers_15 = [
-    Feature(text="In-Store", x=1129, y=3727),
-    Feature(text="Drive Through", x=1104, y=2698),
-    Feature(text="Drive Through", x=2548, y=3727),
-    Feature(text="Delivery", x=2532, y=2681),
-    Feature(text="Drive Through", x=1095, y=1660),
-    Feature(text="Delivery", x=2523, y=1652),
-    Feature(text="Delivery", x=3985, y=3719),
-    Feature(text="Drive Through", x=3993, y=2681),
-    Feature(text="Drive Through", x=3993, y=1635),
-    Feature(text="Drive Through", x=5421, y=3694),
-    Feature(text="Delivery", x=5404, y=2665),
-    Feature(text="Delivery", x=5404, y=1627),
-]
-totals_15 = [
-    Feature(text=0.0, x=1062, y=2979),
-    Feature(text=11.37, x=2465, y=2971),
-    Feature(text=7.98, x=1053, y=1932),
-    Feature(text=14.18, x=2456, y=1931),
-    Feature(text=13.64, x=1004, y=904),
-    Feature(text=6.77, x=2490, y=879),
-    Feature(text=0.0, x=3960, y=2972),
-    Feature(text=0.0, x=3943, y=1925),
-    Feature(text=6.98, x=3943, y=863),
-    Feature(text=19.32, x=5338, y=2947),
-    Feature(text=7.47, x=5388, y=1917),
-    Feature(text=4.06, x=5371, y=870),
-]
+    xs, ys = _to_soa(features)
+    cells = _grid_kernel(ys, xs, tol_y, tol_x, expected_rows, expected_cols)
+    return [None if i < 0 else features[i] for i in cells]
+
+
+def clear_cache():
+    """
+    Empties the coordinate-keyed result caches behind sort_features_A and sort_features_B.
+    """
+    _reading_order.cache_clear()
+    _grid_kernel.cache_clear()
 
 
 def print_outputs(
@@ -290,6 +260,8 @@ if __name__ == "__main__":
     coordinates to associate them with eachother. But I cant get it to work.
     - Ryan
     """
+    from _demo_data import numbers_1, registers_1, times_1, totals_1
+
     times_1 = sort_features_A(times_1)
     numbers_1 = sort_features_A(numbers_1)
     registers_1 = sort_features_A(registers_1)